@@ -25,23 +25,42 @@ Environment variables:
     OPENAI_API_KEY  - Required for generating summaries (OpenAI-compatible)
     OPENAI_BASE_URL - Optional base URL override (default: https://api.openai.com/v1)
     LLM_MODEL       - Optional model name (default: gpt-4.1-mini)
+    NO_CACHE        - Set to 1 to bypass the local LLM response, feed and article caches
+    FORCE_REFETCH   - Set to 1 to recollect articles even if a fresh article pool is cached
 """
 
 import json
 import os
 import re
 import sys
+import gzip
 import hashlib
+import heapq
+import http.client
+import io
 import time
 import logging
+import math
+import multiprocessing
+import random
+import tempfile
+import threading
 import xml.etree.ElementTree as ET
-from datetime import datetime, timezone, timedelta
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import contextmanager
+from datetime import date, datetime, timezone, timedelta
+from functools import lru_cache
 from pathlib import Path
-from urllib.request import urlopen, Request
-from urllib.error import URLError, HTTPError
-from urllib.parse import quote, urlencode
+from urllib.error import HTTPError
+from urllib.parse import quote, urlencode, urljoin, urlsplit, urlunsplit
 import html
 
+try:
+    import orjson  # optional: faster JSON encode/decode
+except ImportError:
+    orjson = None
+
 # ---------------------------------------------------------------------------
 # Logging
 # ---------------------------------------------------------------------------
@@ -52,6 +71,46 @@ logging.basicConfig(
 )
 log = logging.getLogger("fetch_news")
 
+# ---------------------------------------------------------------------------
+# JSON and file helpers (orjson when installed, stdlib json otherwise)
+# ---------------------------------------------------------------------------
+
+def json_loads(data: bytes | str):
+    """Decode JSON from bytes or str."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_dumps(obj, indent: bool = False) -> bytes:
+    """Encode obj as UTF-8 JSON bytes, non-ASCII kept as-is; indent=True pretty-prints."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    if indent:
+        return json.dumps(obj, ensure_ascii=False, indent=2).encode()
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode()
+
+
+def write_atomic(path: Path, data: bytes) -> None:
+    """Write data to a temp file and rename it over path, so readers never see a partial file."""
+    # Unique name in the same directory (same filesystem, so the rename is
+    # atomic), so concurrent runs never write into each other's temp file
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        try:
+            os.fchmod(fd, 0o644)  # mkstemp creates 0600; keep the data files world-readable
+            # Unbuffered: one write(2) for the whole payload, looping only on a short write
+            view = memoryview(data)
+            while view:
+                view = view[os.write(fd, view):]
+        finally:
+            os.close(fd)
+        os.replace(tmp_name, path)
+    except OSError:
+        os.unlink(tmp_name)
+        raise
+
+
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
@@ -71,9 +130,20 @@ MAX_NEWS = 15
 
 DATA_DIR = Path(__file__).resolve().parent.parent / "client" / "public" / "data"
 
+# Local scratch cache (LLM responses etc.) — kept out of DATA_DIR, which is published
+CACHE_DIR = Path(__file__).resolve().parent.parent / ".cache"
+
 # How many days of history to check for deduplication
 DEDUP_DAYS = 7
 
+# Feed count at which parsing moves to a process pool (see parse_feeds)
+PARSE_PROCESSES_MIN_FEEDS = 20
+
+# How long a collected article pool may be reused by a re-run (seconds)
+ARTICLE_POOL_TTL = 3600
+
+LLM_MODEL = os.environ.get("LLM_MODEL", "gpt-4.1-mini")
+
 # ---------------------------------------------------------------------------
 # RSS / Newsletter Feeds
 # ---------------------------------------------------------------------------
@@ -147,92 +217,277 @@ SUPPLEMENTARY_FEEDS = {
 # ---------------------------------------------------------------------------
 
 HEADERS = {
-    "User-Agent": "Mozilla/5.0 (compatible; AIDailyDigest/2.0; +https://gzxultra.github.io/ai-daily-digest/)"
+    "User-Agent": "Mozilla/5.0 (compatible; AIDailyDigest/2.0; +https://gzxultra.github.io/ai-daily-digest/)",
+    # Feed XML and API JSON compress several-fold; bodies are inflated in http_request
+    "Accept-Encoding": "gzip",
 }
 
 
-def http_get(url: str, timeout: int = 15, accept: str = "*/*") -> bytes:
-    """Fetch URL with retries."""
-    headers = {**HEADERS, "Accept": accept}
+# Idle keep-alive connections keyed by (scheme, host:port), shared by all
+# worker threads. Reusing one skips the TCP + TLS handshake on repeat requests
+# to the same host (HN Algolia, Reddit, retries). urlopen always sends
+# "Connection: close", so it can't do this.
+_IDLE_CONNECTIONS: dict[tuple[str, str], list[http.client.HTTPConnection]] = {}
+_IDLE_LOCK = threading.Lock()
+_MAX_REDIRECTS = 5
+
+# HTTP statuses that are retried (rate limiting and transient server errors)
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+
+def _backoff_delay(attempt: int, base: float = 1, error: HTTPError | None = None) -> float:
+    """
+    Seconds to wait before retry number attempt + 1: the server's Retry-After
+    (delta-seconds form) when a 429/503 carries one, otherwise full-jitter
+    exponential backoff so parallel workers don't retry in lockstep.
+    """
+    retry_after = error.headers.get("Retry-After", "") if error is not None else ""
+    if retry_after.strip().isdigit():
+        return min(int(retry_after), 60)
+    return random.uniform(0, min(30, base * 2 ** attempt))
+
+
+def _checkout_connection(
+    scheme: str, netloc: str, timeout: float
+) -> tuple[http.client.HTTPConnection, bool]:
+    """Take an idle pooled connection for the host, or open a new one."""
+    with _IDLE_LOCK:
+        idle = _IDLE_CONNECTIONS.get((scheme, netloc))
+        conn = idle.pop() if idle else None
+    if conn is not None:
+        conn.timeout = timeout
+        if conn.sock is not None:
+            conn.sock.settimeout(timeout)
+        return conn, True
+    if scheme == "https":
+        return http.client.HTTPSConnection(netloc, timeout=timeout), False
+    return http.client.HTTPConnection(netloc, timeout=timeout), False
+
+
+def _release_connection(
+    scheme: str, netloc: str, conn: http.client.HTTPConnection, resp: http.client.HTTPResponse
+) -> None:
+    """Return the connection to the pool if its response was fully consumed."""
+    if resp.will_close or not resp.isclosed():
+        conn.close()
+        return
+    with _IDLE_LOCK:
+        _IDLE_CONNECTIONS.setdefault((scheme, netloc), []).append(conn)
+
+
+def _send(
+    scheme: str, netloc: str, method: str, path: str,
+    body: bytes | None, headers: dict, timeout: float,
+) -> tuple[http.client.HTTPConnection, http.client.HTTPResponse]:
+    """Send one request, transparently replacing stale pooled connections."""
+    while True:
+        conn, reused = _checkout_connection(scheme, netloc, timeout)
+        try:
+            conn.request(method, path, body=body, headers=headers)
+            return conn, conn.getresponse()
+        except ConnectionError:
+            conn.close()
+            if not reused:
+                raise
+            # The server dropped this idle connection; try the next one
+        except BaseException:
+            conn.close()
+            raise
+
+
+@contextmanager
+def open_url(
+    url: str,
+    method: str = "GET",
+    headers: dict | None = None,
+    body: bytes | None = None,
+    timeout: float = 15,
+):
+    """
+    Open url over a pooled keep-alive connection, following redirects.
+    Yields the http.client response; raises HTTPError on 4xx/5xx like urlopen.
+    """
+    headers = headers or {}
+    for _ in range(_MAX_REDIRECTS + 1):
+        parts = urlsplit(url)
+        path = urlunsplit(("", "", parts.path or "/", parts.query, ""))
+        conn, resp = _send(parts.scheme, parts.netloc, method, path, body, headers, timeout)
+
+        location = resp.getheader("Location")
+        if resp.status in (301, 302, 303, 307, 308) and location:
+            resp.read()
+            _release_connection(parts.scheme, parts.netloc, conn, resp)
+            url = urljoin(url, location)
+            if resp.status == 303 or (resp.status in (301, 302) and method == "POST"):
+                method, body = "GET", None
+            continue
+
+        if resp.status >= 400:
+            data = resp.read()
+            _release_connection(parts.scheme, parts.netloc, conn, resp)
+            raise HTTPError(url, resp.status, resp.reason, resp.msg, io.BytesIO(data))
+
+        try:
+            yield resp
+        finally:
+            _release_connection(parts.scheme, parts.netloc, conn, resp)
+        return
+
+    raise HTTPError(url, resp.status, "Too many redirects", resp.msg, None)
+
+
+def http_request(
+    url: str, timeout: int = 15, headers: dict | None = None
+) -> tuple[int, http.client.HTTPMessage, bytes]:
+    """GET url with retries; returns (status, response headers, body)."""
+    headers = {**HEADERS, **(headers or {})}
     for attempt in range(3):
         try:
-            req = Request(url, headers=headers)
-            with urlopen(req, timeout=timeout) as resp:
-                return resp.read()
-        except (URLError, HTTPError, TimeoutError) as e:
+            with open_url(url, headers=headers, timeout=timeout) as resp:
+                body = resp.read()
+                if resp.getheader("Content-Encoding", "").lower() == "gzip":
+                    body = gzip.decompress(body)
+                return resp.status, resp.msg, body
+        except HTTPError as e:
+            # Only transient statuses are worth retrying; a 404 on a guessed
+            # alternate feed URL won't fix itself in a few seconds.
+            if e.code in RETRY_STATUSES and attempt < 2:
+                time.sleep(_backoff_delay(attempt, error=e))
+            else:
+                raise
+        except (OSError, http.client.HTTPException):
             if attempt < 2:
-                time.sleep(2 ** attempt)
+                time.sleep(_backoff_delay(attempt))
             else:
                 raise
-    return b""
+
+
+def http_get(url: str, timeout: int = 15, accept: str = "*/*") -> bytes:
+    """Fetch URL with retries."""
+    return http_request(url, timeout=timeout, headers={"Accept": accept})[2]
+
+
+def http_get_cached(url: str, timeout: int = 15) -> bytes:
+    """
+    Fetch URL with a conditional GET (If-None-Match / If-Modified-Since)
+    against a local copy under CACHE_DIR/feeds. A 304 transfers no body and
+    the cached copy is returned instead.
+    """
+    if os.environ.get("NO_CACHE", "") == "1":
+        return http_get(url, timeout=timeout)
+
+    key = hashlib.sha1(url.encode()).hexdigest()
+    meta_path = CACHE_DIR / "feeds" / f"{key}.json"
+    body_path = CACHE_DIR / "feeds" / f"{key}.body"
+
+    headers = {"Accept": "*/*"}
+    # A missing, partial or corrupt cache entry is just a miss: send no
+    # validators and refetch, so the next response rewrites it
+    try:
+        meta = json_loads(meta_path.read_bytes())
+        cached_body = body_path.read_bytes()
+    except (OSError, ValueError):
+        meta, cached_body = {}, None
+    if cached_body is not None and isinstance(meta, dict):
+        if meta.get("etag"):
+            headers["If-None-Match"] = meta["etag"]
+        if meta.get("modified"):
+            headers["If-Modified-Since"] = meta["modified"]
+
+    status, resp_headers, body = http_request(url, timeout=timeout, headers=headers)
+    if status == 304 and cached_body is not None:
+        log.info(f"    -> {url[:80]} not modified, using cached copy")
+        return cached_body
+
+    etag = resp_headers.get("ETag")
+    modified = resp_headers.get("Last-Modified")
+    if etag or modified:
+        meta_path.parent.mkdir(parents=True, exist_ok=True)
+        # Body first: meta only ever names validators for a body already on disk
+        write_atomic(body_path, body)
+        write_atomic(meta_path, json_dumps({"url": url, "etag": etag, "modified": modified}))
+    return body
 
 
 def http_get_json(url: str, timeout: int = 15) -> dict:
     """Fetch URL and parse JSON."""
     data = http_get(url, timeout=timeout, accept="application/json")
-    return json.loads(data)
+    return json_loads(data)
 
 
 # ---------------------------------------------------------------------------
 # RSS Fetching (adapted from ai-news-bot/src/news/fetcher.py)
 # ---------------------------------------------------------------------------
 
-def parse_rss(raw_xml: bytes) -> list[dict]:
-    """Parse RSS 2.0 or Atom XML into article dicts."""
-    articles = []
-    try:
-        root = ET.fromstring(raw_xml)
-    except ET.ParseError:
-        return []
-
-    ns = {"atom": "http://www.w3.org/2005/Atom"}
-
-    # RSS 2.0
-    for item in root.findall(".//item"):
-        title_el = item.find("title")
-        link_el = item.find("link")
-        desc_el = item.find("description")
-        pub_el = item.find("pubDate")
-        source_el = item.find("source")
+ATOM_NS = "http://www.w3.org/2005/Atom"
+ATOM_ENTRY = f"{{{ATOM_NS}}}entry"
+
+# Child tag -> article field, per item format. Atom <content> is only a
+# fallback for a missing <summary>.
+_RSS_ITEM_FIELDS = {
+    "title": "title",
+    "link": "link",
+    "description": "description",
+    "pubDate": "published",
+    "source": "rss_source",
+}
+_ATOM_ENTRY_FIELDS = {
+    f"{{{ATOM_NS}}}title": "title",
+    f"{{{ATOM_NS}}}link": "link",
+    f"{{{ATOM_NS}}}summary": "description",
+    f"{{{ATOM_NS}}}content": "content",
+    f"{{{ATOM_NS}}}updated": "published",
+}
 
-        title = (title_el.text or "").strip() if title_el is not None else ""
-        link = (link_el.text or "").strip() if link_el is not None else ""
-        desc = (desc_el.text or "").strip() if desc_el is not None else ""
-        source = (source_el.text or "").strip() if source_el is not None else ""
-        pub = (pub_el.text or "").strip() if pub_el is not None else ""
+_TAG_RE = re.compile(r"<[^>]+>")
 
-        desc = re.sub(r"<[^>]+>", "", html.unescape(desc))[:600]
 
-        if title and link:
-            articles.append({
-                "title": title,
-                "link": link,
-                "description": desc,
-                "rss_source": source,
-                "published": pub,
-            })
-
-    # Atom
-    for entry in root.findall(".//atom:entry", ns):
-        title_el = entry.find("atom:title", ns)
-        link_el = entry.find("atom:link", ns)
-        summary_el = entry.find("atom:summary", ns) or entry.find("atom:content", ns)
-        updated_el = entry.find("atom:updated", ns)
+def parse_rss(raw_xml: bytes) -> list[dict]:
+    """
+    Parse RSS 2.0 or Atom XML into article dicts.
+    Streams the document with iterparse and clears each item once read, so
+    memory is bounded by a single item rather than the whole feed.
+    """
+    articles = []
 
-        title = (title_el.text or "").strip() if title_el is not None else ""
-        link = (link_el.get("href", "") if link_el is not None else "").strip()
-        desc = (summary_el.text or "").strip() if summary_el is not None else ""
-        pub = (updated_el.text or "").strip() if updated_el is not None else ""
-        desc = re.sub(r"<[^>]+>", "", html.unescape(desc))[:600]
+    try:
+        for _, elem in ET.iterparse(io.BytesIO(raw_xml), events=("end",)):
+            if elem.tag == "item":
+                field_map, is_atom = _RSS_ITEM_FIELDS, False
+            elif elem.tag == ATOM_ENTRY:
+                field_map, is_atom = _ATOM_ENTRY_FIELDS, True
+            else:
+                continue
 
-        if title and link:
-            articles.append({
-                "title": title,
-                "link": link,
-                "description": desc,
-                "rss_source": "",
-                "published": pub,
-            })
+            # One pass over the item's children; the first occurrence of a
+            # field wins, as with find()
+            fields = {}
+            for child in elem:
+                name = field_map.get(child.tag)
+                if name is None or name in fields:
+                    continue
+                if is_atom and name == "link":
+                    fields[name] = child.get("href", "").strip()
+                else:
+                    fields[name] = (child.text or "").strip()
+            elem.clear()
+
+            title = fields.get("title", "")
+            link = fields.get("link", "")
+            desc = fields.get("description") or fields.get("content", "")
+            desc = _TAG_RE.sub("", html.unescape(desc))[:600]
+
+            if title and link:
+                articles.append({
+                    "title": title,
+                    "link": link,
+                    "description": desc,
+                    "rss_source": fields.get("rss_source", ""),
+                    "published": fields.get("published", ""),
+                })
+    except ET.ParseError:
+        # Keep whatever items were read before the document broke off
+        pass
 
     return articles
 
@@ -241,36 +496,39 @@ def parse_rss(raw_xml: bytes) -> list[dict]:
 # Date filtering
 # ---------------------------------------------------------------------------
 
+_PUB_DATE_FORMATS = (
+    "%a, %d %b %Y %H:%M:%S %z",   # RFC 2822: Mon, 01 Jan 2026 12:00:00 +0000
+    "%a, %d %b %Y %H:%M:%S %Z",   # RFC 2822 with named TZ: Mon, 01 Jan 2026 12:00:00 GMT
+    "%Y-%m-%dT%H:%M:%S%z",         # ISO 8601: 2026-01-01T12:00:00+00:00
+    "%Y-%m-%dT%H:%M:%SZ",          # ISO 8601 UTC: 2026-01-01T12:00:00Z
+    "%Y-%m-%d %H:%M:%S",           # Simple: 2026-01-01 12:00:00
+    "%Y-%m-%d",                    # Date only: 2026-01-01
+)
+
+# 'Z' suffix -> '+00:00' for %z, and named TZ abbreviations Python can't parse
+_ZULU_RE = re.compile(r"Z$")
+_TZ_NAME_RE = re.compile(r"\s+(GMT|UTC|EST|PST|CST)$")
+_TZ_OFFSETS = {"GMT": " +0000", "UTC": " +0000", "EST": " -0500", "PST": " -0800", "CST": " -0600"}
+_ISO_DATE_RE = re.compile(r"(\d{4})-(\d{2})-(\d{2})")
+
+
+@lru_cache(maxsize=4096)
 def parse_pub_date(pub_str: str) -> datetime | None:
     """
     Parse a publication date string from RSS/Atom into a timezone-aware datetime.
     Supports RFC 2822 (RSS), ISO 8601 (Atom), and common variants.
     Returns None if parsing fails.
+    Memoized: the date filter and every prompt build parse the same strings.
     """
     if not pub_str or not pub_str.strip():
         return None
 
     s = pub_str.strip()
 
-    # Try common formats
-    formats = [
-        "%a, %d %b %Y %H:%M:%S %z",   # RFC 2822: Mon, 01 Jan 2026 12:00:00 +0000
-        "%a, %d %b %Y %H:%M:%S %Z",   # RFC 2822 with named TZ: Mon, 01 Jan 2026 12:00:00 GMT
-        "%Y-%m-%dT%H:%M:%S%z",         # ISO 8601: 2026-01-01T12:00:00+00:00
-        "%Y-%m-%dT%H:%M:%SZ",          # ISO 8601 UTC: 2026-01-01T12:00:00Z
-        "%Y-%m-%d %H:%M:%S",           # Simple: 2026-01-01 12:00:00
-        "%Y-%m-%d",                    # Date only: 2026-01-01
-    ]
-
-    # Normalize: replace 'Z' suffix with '+00:00' for %z
-    s_norm = re.sub(r'Z$', '+00:00', s)
-    # Normalize named TZ abbreviations that Python can't parse
-    s_norm = re.sub(r'\s+(GMT|UTC)$', ' +0000', s_norm)
-    s_norm = re.sub(r'\s+EST$', ' -0500', s_norm)
-    s_norm = re.sub(r'\s+PST$', ' -0800', s_norm)
-    s_norm = re.sub(r'\s+CST$', ' -0600', s_norm)
+    s_norm = _ZULU_RE.sub("+00:00", s)
+    s_norm = _TZ_NAME_RE.sub(lambda m: _TZ_OFFSETS[m.group(1)], s_norm)
 
-    for fmt in formats:
+    for fmt in _PUB_DATE_FORMATS:
         try:
             dt = datetime.strptime(s_norm, fmt)
             if dt.tzinfo is None:
@@ -280,7 +538,7 @@ def parse_pub_date(pub_str: str) -> datetime | None:
             continue
 
     # Last resort: try to extract a YYYY-MM-DD from the string
-    m = re.search(r'(\d{4})-(\d{2})-(\d{2})', s)
+    m = _ISO_DATE_RE.search(s)
     if m:
         try:
             return datetime(
@@ -307,13 +565,13 @@ def is_recent_article(article: dict, target_date: str, max_age_days: int = 2) ->
         return True
 
     try:
-        target_dt = datetime.strptime(target_date, "%Y-%m-%d").replace(tzinfo=timezone.utc)
+        target_day = date.fromisoformat(target_date)
     except ValueError:
         return True
 
     # Allow articles from up to max_age_days before target_date
     # and up to 1 day after (to handle timezone edge cases)
-    delta = (target_dt.date() - dt.date()).days
+    delta = (target_day - dt.date()).days
     if delta < -1 or delta > max_age_days:
         return False
 
@@ -321,57 +579,91 @@ def is_recent_article(article: dict, target_date: str, max_age_days: int = 2) ->
     return True
 
 
+def _fetch_newsletter_source(
+    source_name: str, feed_urls: list[str], target_date: str, max_per_source: int
+) -> list[dict]:
+    """Fetch one newsletter, trying its alternate feed URLs in order."""
+    for feed_url in feed_urls:
+        try:
+            log.info(f"  Fetching {source_name}: {feed_url[:80]}...")
+            raw = http_get_cached(feed_url)
+            articles = parse_rss(raw)
+            if articles:
+                for a in articles:
+                    a["source"] = source_name
+                # Apply date filter: newsletters may have weekly digests, allow 2 days
+                before = len(articles)
+                articles = [a for a in articles if is_recent_article(a, target_date, max_age_days=2)]
+                articles = articles[:max_per_source]
+                log.info(f"    -> {source_name}: {len(articles)} articles (date-filtered from {before})")
+                return articles  # Got articles from this source, skip alternates
+        except Exception as e:
+            log.warning(f"    -> {source_name} failed: {e}")
+            continue
+
+    log.warning(f"  Could not fetch any feed for {source_name}")
+    return []
+
+
 def fetch_newsletter_feeds(target_date: str, max_per_source: int = 10) -> list[dict]:
     """Fetch articles from all newsletter RSS feeds, filtered to target_date ± 2 days."""
     all_articles = []
 
-    for source_name, feed_urls in NEWSLETTER_FEEDS.items():
-        fetched = False
-        for feed_url in feed_urls:
-            try:
-                log.info(f"  Fetching {source_name}: {feed_url[:80]}...")
-                raw = http_get(feed_url)
-                articles = parse_rss(raw)
-                if articles:
-                    for a in articles:
-                        a["source"] = source_name
-                    # Apply date filter: newsletters may have weekly digests, allow 2 days
-                    before = len(articles)
-                    articles = [a for a in articles if is_recent_article(a, target_date, max_age_days=2)]
-                    articles = articles[:max_per_source]
-                    log.info(f"    -> {len(articles)} articles (date-filtered from {before})")
-                    all_articles.extend(articles)
-                    fetched = True
-                    break  # Got articles from this source, skip alternates
-            except Exception as e:
-                log.warning(f"    -> Failed: {e}")
-                continue
-
-        if not fetched:
-            log.warning(f"  Could not fetch any feed for {source_name}")
+    # Feeds are I/O-bound, so fetch every source concurrently; alternates for
+    # a single source are still tried in order inside its worker.
+    with ThreadPoolExecutor(max_workers=len(NEWSLETTER_FEEDS)) as ex:
+        futures = [
+            ex.submit(_fetch_newsletter_source, name, urls, target_date, max_per_source)
+            for name, urls in NEWSLETTER_FEEDS.items()
+        ]
+        for future in futures:
+            all_articles.extend(future.result())
 
     return all_articles
 
 
+def _download_feed(source_name: str, feed_url: str) -> bytes | None:
+    """Download one feed, returning None if it failed."""
+    try:
+        log.info(f"  Fetching {source_name}: {feed_url[:80]}...")
+        return http_get_cached(feed_url)
+    except Exception as e:
+        log.warning(f"    -> {source_name} failed: {e}")
+        return None
+
+
+def parse_feeds(raws: list[bytes]) -> list[list[dict]]:
+    """
+    Parse several downloaded feeds, in worker processes once there are enough
+    of them for parsing to outweigh process start-up (threads can't help here:
+    parsing holds the GIL).
+    """
+    if len(raws) < PARSE_PROCESSES_MIN_FEEDS:
+        return [parse_rss(raw) for raw in raws]
+    # spawn rather than fork: other collector threads may be running
+    with ProcessPoolExecutor(mp_context=multiprocessing.get_context("spawn")) as ex:
+        return list(ex.map(parse_rss, raws))
+
+
 def fetch_supplementary_feeds(target_date: str, max_per_source: int = 5) -> list[dict]:
     """Fetch articles from supplementary tech RSS feeds, filtered to target_date ± 1 day."""
     all_articles = []
 
-    for source_name, feed_url in SUPPLEMENTARY_FEEDS.items():
-        try:
-            log.info(f"  Fetching {source_name}: {feed_url[:80]}...")
-            raw = http_get(feed_url)
-            articles = parse_rss(raw)
-            for a in articles:
-                a["source"] = source_name
-            # Supplementary feeds: stricter — only today or yesterday
-            before = len(articles)
-            articles = [a for a in articles if is_recent_article(a, target_date, max_age_days=1)]
-            articles = articles[:max_per_source]
-            log.info(f"    -> {len(articles)} articles (date-filtered from {before})")
-            all_articles.extend(articles)
-        except Exception as e:
-            log.warning(f"    -> Failed: {e}")
+    # Download concurrently (I/O-bound), then parse as one batch (CPU-bound)
+    with ThreadPoolExecutor(max_workers=len(SUPPLEMENTARY_FEEDS)) as ex:
+        raws = list(ex.map(_download_feed, SUPPLEMENTARY_FEEDS, SUPPLEMENTARY_FEEDS.values()))
+    fetched = [(name, raw) for name, raw in zip(SUPPLEMENTARY_FEEDS, raws) if raw is not None]
+    parsed = parse_feeds([raw for _, raw in fetched])
+
+    for (source_name, _), articles in zip(fetched, parsed):
+        for a in articles:
+            a["source"] = source_name
+        # Supplementary feeds: stricter — only today or yesterday
+        before = len(articles)
+        articles = [a for a in articles if is_recent_article(a, target_date, max_age_days=1)]
+        articles = articles[:max_per_source]
+        log.info(f"    -> {source_name}: {len(articles)} articles (date-filtered from {before})")
+        all_articles.extend(articles)
 
     return all_articles
 
@@ -380,6 +672,21 @@ def fetch_supplementary_feeds(target_date: str, max_per_source: int = 5) -> list
 # Hacker News (Algolia API)
 # ---------------------------------------------------------------------------
 
+def _search_hacker_news(query: str, window_start: int, window_end: int) -> list[dict]:
+    """Run one Algolia story search; returns its raw hits ([] on failure)."""
+    url = (
+        f"https://hn.algolia.com/api/v1/search?"
+        f"query={quote(query)}&tags=story&hitsPerPage=15"
+        f"&numericFilters=created_at_i>{window_start},created_at_i<{window_end}"
+    )
+    log.info(f"  HN search: {query}")
+    try:
+        return http_get_json(url).get("hits", [])
+    except Exception as e:
+        log.warning(f"    -> HN search failed for '{query}': {e}")
+        return []
+
+
 def fetch_hacker_news(target_date: str, max_items: int = 15) -> list[dict]:
     """Fetch top AI-related stories from Hacker News via Algolia API, filtered to target_date."""
     articles = []
@@ -390,7 +697,7 @@ def fetch_hacker_news(target_date: str, max_items: int = 15) -> list[dict]:
 
     # Compute the Unix timestamp window: target_date ± 1 day
     try:
-        target_dt = datetime.strptime(target_date, "%Y-%m-%d").replace(tzinfo=timezone.utc)
+        target_dt = datetime.fromisoformat(target_date).replace(tzinfo=timezone.utc)
     except ValueError:
         target_dt = datetime.now(timezone.utc)
 
@@ -398,45 +705,40 @@ def fetch_hacker_news(target_date: str, max_items: int = 15) -> list[dict]:
     window_start = int((target_dt - timedelta(days=1)).timestamp())
     window_end   = int((target_dt + timedelta(days=1)).timestamp())
 
+    # Queries are independent round trips to the same host; run them together
+    with ThreadPoolExecutor(max_workers=len(queries)) as ex:
+        futures = [ex.submit(_search_hacker_news, q, window_start, window_end) for q in queries]
+        hit_lists = [future.result() for future in futures]
+
     seen_ids = set()
-    for query in queries:
-        try:
-            url = (
-                f"https://hn.algolia.com/api/v1/search?"
-                f"query={quote(query)}&tags=story&hitsPerPage=15"
-                f"&numericFilters=created_at_i>{window_start},created_at_i<{window_end}"
-            )
-            log.info(f"  HN search: {query}")
-            data = http_get_json(url)
-            for hit in data.get("hits", []):
-                obj_id = hit.get("objectID", "")
-                if obj_id in seen_ids:
-                    continue
-                seen_ids.add(obj_id)
+    for hits in hit_lists:
+        for hit in hits:
+            obj_id = hit.get("objectID", "")
+            if obj_id in seen_ids:
+                continue
+            seen_ids.add(obj_id)
 
-                points = hit.get("points", 0) or 0
-                num_comments = hit.get("num_comments", 0) or 0
+            points = hit.get("points", 0) or 0
+            num_comments = hit.get("num_comments", 0) or 0
 
-                # Quality filter: require minimum engagement
-                if points < 20:
-                    continue
+            # Quality filter: require minimum engagement
+            if points < 20:
+                continue
 
-                title = hit.get("title", "")
-                link = hit.get("url", "") or f"https://news.ycombinator.com/item?id={obj_id}"
-                created_at = hit.get("created_at", "")
+            title = hit.get("title", "")
+            link = hit.get("url", "") or f"https://news.ycombinator.com/item?id={obj_id}"
+            created_at = hit.get("created_at", "")
 
-                articles.append({
-                    "title": title,
-                    "link": link,
-                    "description": f"[{points} points, {num_comments} comments on HN] {title}",
-                    "source": "Hacker News",
-                    "rss_source": "",
-                    "published": created_at,
-                    "date_unknown": False,
-                    "hn_points": points,
-                })
-        except Exception as e:
-            log.warning(f"    -> HN search failed for '{query}': {e}")
+            articles.append({
+                "title": title,
+                "link": link,
+                "description": f"[{points} points, {num_comments} comments on HN] {title}",
+                "source": "Hacker News",
+                "rss_source": "",
+                "published": created_at,
+                "date_unknown": False,
+                "hn_points": points,
+            })
 
     # Sort by points descending, take top items
     articles.sort(key=lambda x: x.get("hn_points", 0), reverse=True)
@@ -482,45 +784,108 @@ def fetch_reddit(subreddit: str, target_date: str, max_items: int = 10) -> list[
 # Deduplication
 # ---------------------------------------------------------------------------
 
+_NONWORD_RE = re.compile(r"[^\w\s]")
+
+
 def normalize_title(title: str) -> str:
     """Normalize a title for dedup comparison."""
-    t = title.lower().strip()
-    t = re.sub(r"[^\w\s]", "", t)
-    t = re.sub(r"\s+", " ", t)
-    return t
+    t = _NONWORD_RE.sub("", title.lower())
+    # split/join collapses whitespace runs and trims the ends in one C-level pass
+    return " ".join(t.split())
 
 
-def title_fingerprint(title: str) -> str:
+def _fp(s: str) -> bytes:
+    """48-bit fingerprint: the raw 6-byte blake2b digest."""
+    return hashlib.blake2b(s.encode(), digest_size=6).digest()
+
+
+def title_fingerprint(title: str) -> bytes:
     """Create a short hash fingerprint of a normalized title."""
-    return hashlib.md5(normalize_title(title).encode()).hexdigest()[:12]
+    return _fp(normalize_title(title))
+
 
+class BloomFilter:
+    """
+    Compact set of fingerprints for history dedup (~14 bits per entry at the
+    default error rate, vs. a full bytes object per entry in a set).
+    Lookups may give false positives at roughly error_rate, never false
+    negatives — i.e. a fresh article is very occasionally treated as seen.
+    Keys must already be uniform hashes (the digests from _fp), so the bit
+    positions are derived from the key itself without hashing it again.
+    """
 
-def load_historical_titles(data_dir: Path, days: int = DEDUP_DAYS) -> set[str]:
+    def __init__(self, capacity: int, error_rate: float = 0.001):
+        capacity = max(capacity, 1)
+        self.num_bits = max(64, int(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.num_hashes = max(1, round(self.num_bits / capacity * math.log(2)))
+        self.bits = bytearray((self.num_bits + 7) // 8)
+        self.count = 0
+
+    def _positions(self, key: bytes):
+        # Double hashing: k bit positions from the two halves of the digest
+        h = int.from_bytes(key, "little")
+        h1 = h & 0xFFFFFF
+        h2 = (h >> 24) | 1
+        return [(h1 + i * h2) % self.num_bits for i in range(self.num_hashes)]
+
+    def add(self, key: bytes) -> None:
+        added = False
+        for pos in self._positions(key):
+            byte, mask = pos >> 3, 1 << (pos & 7)
+            if not self.bits[byte] & mask:
+                self.bits[byte] |= mask
+                added = True
+        if added:
+            self.count += 1
+
+    def __contains__(self, key: bytes) -> bool:
+        return all(self.bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(key))
+
+    def __len__(self) -> int:
+        return self.count
+
+
+def _historical_fingerprints(fpath: Path) -> list[bytes]:
+    """Fingerprints of one day's digest file (empty if missing or unreadable)."""
+    try:
+        data = json_loads(fpath.read_bytes())
+    except (OSError, ValueError):
+        return []
+
+    # Hand-edited or older files may not match the current shape; skip
+    # whatever isn't, rather than failing the whole collection step
+    news = data.get("news") if isinstance(data, dict) else None
+    if not isinstance(news, list):
+        return []
+
+    fingerprints = []
+    for item in news:
+        if not isinstance(item, dict):
+            continue
+        title = item.get("title")
+        # Fingerprint both EN and ZH titles, plus source URLs for URL-based dedup
+        if isinstance(title, dict):
+            for t in (title.get("en"), title.get("zh")):
+                if t and isinstance(t, str):
+                    fingerprints.append(title_fingerprint(t))
+        url = item.get("sourceUrl")
+        if url and isinstance(url, str):
+            fingerprints.append(_fp(url))
+    return fingerprints
+
+
+def load_historical_titles(data_dir: Path, days: int = DEDUP_DAYS) -> BloomFilter:
     """Load title fingerprints from the last N days of data."""
-    fingerprints = set()
+    # ~15 stories a day, each contributing EN title, ZH title and URL
+    fingerprints = BloomFilter(capacity=days * 64)
     today = datetime.now(timezone.utc).date()
+    paths = [data_dir / f"{(today - timedelta(days=i)).isoformat()}.json" for i in range(1, days + 1)]
 
-    for i in range(1, days + 1):
-        d = today - timedelta(days=i)
-        fpath = data_dir / f"{d.isoformat()}.json"
-        if fpath.exists():
-            try:
-                with open(fpath, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-                for item in data.get("news", []):
-                    # Fingerprint both EN and ZH titles
-                    en_title = item.get("title", {}).get("en", "")
-                    zh_title = item.get("title", {}).get("zh", "")
-                    if en_title:
-                        fingerprints.add(title_fingerprint(en_title))
-                    if zh_title:
-                        fingerprints.add(title_fingerprint(zh_title))
-                    # Also add source URLs for URL-based dedup
-                    url = item.get("sourceUrl", "")
-                    if url:
-                        fingerprints.add(hashlib.md5(url.encode()).hexdigest()[:12])
-            except Exception:
-                pass
+    # Small independent files: overlap the reads, fill the filter on this thread
+    with ThreadPoolExecutor(max_workers=4) as ex:
+        for day_fps in ex.map(_historical_fingerprints, paths):
+            for fp in day_fps:
+                fingerprints.add(fp)
 
     log.info(f"  Loaded {len(fingerprints)} historical fingerprints from {days} days")
     return fingerprints
@@ -528,7 +893,7 @@ def load_historical_titles(data_dir: Path, days: int = DEDUP_DAYS) -> set[str]:
 
 def deduplicate_articles(
     articles: list[dict],
-    historical_fps: set[str],
+    historical_fps: BloomFilter,
 ) -> list[dict]:
     """Remove duplicate articles (within batch and against history)."""
     seen = set()
@@ -536,7 +901,7 @@ def deduplicate_articles(
 
     for a in articles:
         fp = title_fingerprint(a["title"])
-        url_fp = hashlib.md5(a["link"].encode()).hexdigest()[:12] if a["link"] else ""
+        url_fp = _fp(a["link"]) if a["link"] else b""
 
         # Skip if seen in this batch or in history
         if fp in seen or fp in historical_fps:
@@ -559,8 +924,8 @@ def deduplicate_articles(
 
 AI_KEYWORDS = [
     "ai", "artificial intelligence", "machine learning", "deep learning",
-    "llm", "large language model", "chatgpt", "gpt", "openai", "anthropic",
-    "claude", "gemini", "deepmind", "neural", "generative", "transformer",
+    "llm", "large language model", "chatgpt", "gpt", "openai", "anthropic", "xai",
+    "claude", "gemini", "deepmind", "neural", "generative", "genai", "transformer",
     "ai agent", "ai safety", "ai regulation", "ai model", "diffusion",
     "copilot", "midjourney", "stable diffusion", "nvidia", "gpu",
     "foundation model", "fine-tuning", "rag", "retrieval augmented",
@@ -577,87 +942,198 @@ AI_KEYWORDS = [
 ]
 
 
+# All keywords folded into one pattern so each article is scanned once,
+# rather than once per keyword. Keywords must start a word, so "ai" no longer
+# hits "said" or "email", nor "rag" "storage"; they may end in a plural "s" or
+# a version number ("LLMs", "GPT4", "Qwen2.5", "Llama3").
+_AI_RE = re.compile(
+    r"\b(?:" + "|".join(re.escape(kw) for kw in AI_KEYWORDS) + r")(?:s|[\d.]+)?\b",
+    re.IGNORECASE,
+)
+
+
 def is_ai_related(article: dict) -> bool:
     """Check if an article is AI-related."""
-    text = (article["title"] + " " + article.get("description", "")).lower()
-    return any(kw in text for kw in AI_KEYWORDS)
+    # Title first: most hits are decided there, without scanning (or building
+    # a concatenation with) the longer description
+    return (
+        _AI_RE.search(article["title"]) is not None
+        or _AI_RE.search(article.get("description", "")) is not None
+    )
 
 
 # ---------------------------------------------------------------------------
 # OpenAI / LLM Integration
 # ---------------------------------------------------------------------------
 
-def call_llm(prompt: str, system_prompt: str = "", max_tokens: int = 8000) -> str:
-    """Call OpenAI-compatible chat completions API with retry logic."""
+def _read_completion_stream(resp) -> tuple[str, str]:
+    """
+    Accumulate a streamed (SSE) chat completion.
+    Returns (content, finish_reason).
+    """
+    parts = []
+    finish_reason = "unknown"
+    chars = 0
+    next_progress = 4000
+
+    for line in resp:
+        if not line.startswith(b"data:"):
+            continue
+        data = line[5:].strip()
+        if data == b"[DONE]":
+            break
+        event = json_loads(data)
+        if "error" in event:
+            raise RuntimeError(f"LLM stream error: {json.dumps(event['error'])[:300]}")
+
+        for choice in event.get("choices", [])[:1]:
+            piece = (choice.get("delta") or {}).get("content")
+            if piece:
+                parts.append(piece)
+                chars += len(piece)
+            finish_reason = choice.get("finish_reason") or finish_reason
+
+        if chars >= next_progress:
+            log.info(f"    ... {chars} chars streamed")
+            next_progress += 4000
+
+    return "".join(parts), finish_reason
+
+
+def call_llm(
+    prompt: str,
+    system_prompt: str = "",
+    max_tokens: int = 8000,
+    response_format: dict | None = None,
+) -> str:
+    """
+    Call OpenAI-compatible chat completions API with retry logic.
+    The response is streamed, falling back to a plain request if the provider
+    rejects streaming. response_format is passed through as-is (e.g. a
+    json_schema for structured output) and dropped if the provider rejects it.
+    """
     api_key = os.environ.get("OPENAI_API_KEY", "")
     if not api_key:
         raise RuntimeError("OPENAI_API_KEY environment variable is not set")
 
     base_url = os.environ.get("OPENAI_BASE_URL", "https://api.openai.com/v1").rstrip("/")
-    model = os.environ.get("LLM_MODEL", "gpt-4.1-mini")
+    model = LLM_MODEL
 
     messages = []
     if system_prompt:
         messages.append({"role": "system", "content": system_prompt})
     messages.append({"role": "user", "content": prompt})
 
-    payload = json.dumps({
+    body = {
         "model": model,
         "messages": messages,
         "temperature": 0.3,
+        "top_p": 0.9,
         "max_tokens": max_tokens,
-    }).encode()
+    }
+    if response_format:
+        body["response_format"] = response_format
 
     url = f"{base_url}/chat/completions"
     last_error = None
 
+    # Identical requests (e.g. a re-run after a later step failed) are served
+    # from disk instead of paying for the same completion twice. Keyed on the
+    # request without the "stream" flag, so it survives a streaming fallback.
+    cache_path = None
+    if os.environ.get("NO_CACHE", "") != "1":
+        cache_key = hashlib.sha256(url.encode() + b"\n" + json_dumps(body)).hexdigest()
+        cache_path = CACHE_DIR / "llm" / f"{cache_key}.json"
+        try:
+            cached = json_loads(cache_path.read_bytes())["content"]
+        except FileNotFoundError:
+            cached = None
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            # Unreadable entry: a miss; the fresh response below overwrites it
+            log.warning(f"  Ignoring unreadable LLM cache entry {cache_key[:12]}: {e}")
+            cached = None
+        if isinstance(cached, str):
+            log.info(f"  LLM cache hit ({cache_key[:12]}), skipping API call")
+            return cached
+
+    # Stream the completion so the connection stays busy while tokens are
+    # generated; providers that reject "stream" get a plain request instead.
+    stream = True
+
     for attempt in range(3):
         try:
-            req = Request(
+            log.info(f"  Calling LLM ({model}) ... (attempt {attempt + 1})")
+            with open_url(
                 url,
-                data=payload,
+                method="POST",
+                # http.client sends no User-Agent of its own, and some gateways
+                # reject requests without one. Not HEADERS as a whole: its
+                # Accept-Encoding would buffer the SSE stream behind gzip.
                 headers={
+                    "User-Agent": HEADERS["User-Agent"],
                     "Content-Type": "application/json",
                     "Authorization": f"Bearer {api_key}",
                 },
-                method="POST",
-            )
-            log.info(f"  Calling LLM ({model}) ... (attempt {attempt + 1})")
-            with urlopen(req, timeout=180) as resp:
-                result = json.loads(resp.read())
-
-            # Defensive: handle missing 'content' key (e.g. Gemini finish_reason=length)
-            choice = result["choices"][0]
-            message = choice.get("message", {})
-            content = message.get("content") or ""
-            finish_reason = choice.get("finish_reason", "unknown")
+                body=json_dumps({**body, "stream": True} if stream else body),
+                timeout=180,
+            ) as resp:
+                # Some endpoints ignore "stream" and answer with a plain JSON
+                # completion; go by what was actually sent back
+                content_type = resp.getheader("Content-Type", "")
+                if stream and content_type.lower().startswith("text/event-stream"):
+                    content, finish_reason = _read_completion_stream(resp)
+                    response_text = content
+                else:
+                    result = json_loads(resp.read())
+                    response_text = json.dumps(result)
+
+                    # Defensive: handle missing 'content' key (e.g. Gemini finish_reason=length)
+                    choice = result["choices"][0]
+                    message = choice.get("message", {})
+                    content = message.get("content") or ""
+                    finish_reason = choice.get("finish_reason", "unknown")
 
             if not content:
                 raise RuntimeError(
                     f"LLM returned empty content (finish_reason={finish_reason}). "
-                    f"Response: {json.dumps(result)[:300]}"
+                    f"Response: {response_text[:300]}"
                 )
 
             log.info(f"  LLM response: {len(content)} chars (finish={finish_reason})")
+            # Don't cache truncated output, so a re-run gets a fresh attempt
+            if cache_path and finish_reason != "length":
+                cache_path.parent.mkdir(parents=True, exist_ok=True)
+                write_atomic(cache_path, json_dumps({"content": content}))
             return content
 
         except HTTPError as e:
-            body = ""
+            error_body = ""
             try:
-                body = e.read().decode(errors="replace")[:300]
+                error_body = e.read().decode(errors="replace")
             except Exception:
                 pass
-            last_error = RuntimeError(f"HTTP {e.code} from LLM API: {body}")
-            log.warning(f"  LLM attempt {attempt + 1} failed: HTTP {e.code} — {body}")
-            if e.code in (429, 500, 502, 503, 504):
-                time.sleep(5 * (attempt + 1))
+            detail = error_body[:300]
+            last_error = RuntimeError(f"HTTP {e.code} from LLM API: {detail}")
+            log.warning(f"  LLM attempt {attempt + 1} failed: HTTP {e.code} — {detail}")
+            if e.code in RETRY_STATUSES:
+                time.sleep(_backoff_delay(attempt, base=5, error=e))
+                continue
+            # Only a rejection of streaming or of structured output is worth a
+            # plain retry; auth and context-length errors fail the same either way
+            if stream and "stream" in error_body.lower():
+                log.warning("  Provider rejected streaming; retrying without it")
+                stream = False
+                continue
+            if "response_format" in body and any(k in error_body.lower() for k in ("response_format", "json_schema")):
+                log.warning("  Provider rejected response_format; retrying without it")
+                del body["response_format"]
                 continue
             raise last_error  # 4xx errors (except 429) are not retryable
 
-        except (URLError, TimeoutError) as e:
+        except (OSError, http.client.HTTPException) as e:
             last_error = e
             log.warning(f"  LLM attempt {attempt + 1} failed: {e}")
-            time.sleep(5 * (attempt + 1))
+            time.sleep(_backoff_delay(attempt, base=5))
             continue
 
         except RuntimeError:
@@ -695,25 +1171,152 @@ def build_article_list_text(articles: list[dict]) -> str:
     return "\n\n".join(lines)
 
 
-def generate_digest(articles: list[dict], target_date: str) -> list[dict]:
+# Structured-output schema for the digest: the API guarantees parseable JSON
+# in this shape, so no markdown-fence stripping is needed.
+DIGEST_RESPONSE_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "news_digest",
+        "strict": True,
+        "schema": {
+            "type": "object",
+            "properties": {
+                "items": {
+                    "type": "array",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "id": {"type": "string"},
+                            "category_en": {"type": "string", "enum": list(CATEGORIES)},
+                            "category_zh": {"type": "string"},
+                            "category_color": {"type": "string"},
+                            "title_en": {"type": "string"},
+                            "title_zh": {"type": "string"},
+                            "summary_en": {"type": "string"},
+                            "summary_zh": {"type": "string"},
+                            "source": {"type": "string"},
+                            "sourceUrl": {"type": "string"},
+                        },
+                        "required": [
+                            "id", "category_en", "category_zh", "category_color",
+                            "title_en", "title_zh", "summary_en", "summary_zh",
+                            "source", "sourceUrl",
+                        ],
+                        "additionalProperties": False,
+                    },
+                },
+            },
+            "required": ["items"],
+            "additionalProperties": False,
+        },
+    },
+}
+
+
+def _digest_system_prompt() -> str:
     """
-    Two-stage LLM pipeline (adapted from ai-news-bot):
-      Stage 1: Select 10-15 most important stories
-      Stage 2: Generate bilingual structured JSON output
+    Static digest instructions. Kept in the system message, separate from the
+    per-day article list, so every request starts with a byte-identical
+    prefix that the API's prompt cache can reuse.
+    """
+    categories_desc = "\n".join(
+        f'  - "{en}" (Chinese: "{info["zh"]}", color: "{info["color"]}")'
+        for en, info in CATEGORIES.items()
+    )
+    return f"""You are a senior AI industry analyst with extremely high standards. From the articles provided by the user, select the most important stories and create a bilingual (English + Chinese) news digest of them.
+
+## OUTPUT FORMAT
+
+Return a JSON object of the form {{"items": [...]}}, with one element per selected story, most important first. Each element of "items" must have this EXACT structure:
+
+{{
+  "id": "short-kebab-case-id",
+  "category_en": "Category Name",
+  "category_zh": "分类名称",
+  "category_color": "#hex",
+  "title_en": "Concise English headline",
+  "title_zh": "简洁中文标题",
+  "summary_en": "English analytical summary (3-5 sentences, ~400-600 chars). Self-contained: include all key facts, numbers, and context. Cover: what happened, technical details/metrics, why it matters.",
+  "summary_zh": "中文分析摘要（3-5句，约150-250字）。必须自包含：包含所有关键事实、数据和背景。涵盖：发生了什么、技术细节/指标、为什么重要。",
+  "source": "Source Name",
+  "sourceUrl": "https://..."
+}}
+
+## AVAILABLE CATEGORIES (use ONLY these):
+{categories_desc}
+
+## QUALITY REQUIREMENTS:
+- id: short, descriptive, kebab-case (e.g., "gpt5-release", "eu-ai-act-update")
+- Summaries must be SELF-CONTAINED
+- Chinese summaries should read naturally, use 「」for quotes
+- source: use the newsletter/platform name
+- sourceUrl: use the article's actual URL"""
+
+
+def _digest_items(parsed) -> list[dict] | None:
+    """Items from a decoded reply, {"items": [...]} or a bare array; None for any other shape."""
+    if isinstance(parsed, dict):
+        parsed = parsed.get("items")
+    if not isinstance(parsed, list):
+        return None
+    return [item for item in parsed if isinstance(item, dict)]
+
+
+def _parse_digest_items(raw: str) -> list[dict]:
+    """Parse the structured digest response into its raw items."""
+    raw = raw.strip()
+    # Providers that ignore response_format may still fence the JSON
+    if raw.startswith("```"):
+        raw = raw.partition("\n")[2].rsplit("```", 1)[0].strip()
+
+    # Structured output is always valid JSON in the schema's shape unless the
+    # response was cut off at max_tokens; anything else (truncated, or a
+    # provider that loosened the schema) goes through recovery.
+    try:
+        items = _digest_items(json_loads(raw))
+    except ValueError:
+        items = None
+    if items is not None:
+        return items
+
+    log.warning("  Digest JSON truncated or malformed, attempting recovery...")
+    # Close the items array after the last complete object
+    last_brace = raw.rfind("}")
+    if last_brace > 0:
+        recovered = raw[:last_brace + 1] + ("]" if raw.startswith("[") else "]}")
+        try:
+            items = _digest_items(json_loads(recovered))
+        except ValueError as e2:
+            log.error(f"  Recovery failed: {e2}")
+            return []
+        if items is not None:
+            log.info(f"  Recovered {len(items)} items from truncated response")
+            return items
+    log.error("  Recovery failed: no digest items in the response")
+    return []
+
+
+def generate_digest(
+    articles: list[dict], target_date: str, source_counts: Counter | None = None
+) -> list[dict]:
+    """
+    Single-call LLM pipeline (adapted from ai-news-bot's two stages): the model
+    selects the 10-12 most important stories and writes their bilingual
+    structured entries in the same response.
+    If source_counts is given, each emitted item is tallied into it by source.
     """
 
     article_text = build_article_list_text(articles)
 
-    # ── Stage 1: Selection ──────────────────────────────────────────────
-    stage1_prompt = f"""Below are {len(articles)} AI-related news articles collected for {target_date} from curated sources including AlphaSignal, Ben's Bites, Import AI, TLDR AI, The Batch, Hacker News, and Reddit.
+    prompt = f"""Below are {len(articles)} AI-related news articles collected for {target_date} from curated sources including AlphaSignal, Ben's Bites, Import AI, TLDR AI, The Batch, Hacker News, and Reddit.
 
 Some articles are marked [DATE UNKNOWN] — their publication date could not be parsed from the RSS feed. Treat these with extra skepticism: only include them if the content is clearly very recent and highly relevant.
 
 {article_text}
 
-## YOUR TASK — STAGE 1: NEWS SELECTION
+## YOUR TASK: SELECT THE NEWS, THEN WRITE THE DIGEST
 
-You are a senior AI industry analyst with extremely high standards. Select exactly 10-15 of the MOST IMPORTANT stories. Pursue a HIGH signal-to-noise ratio.
+Select 10-12 of the MOST IMPORTANT stories. Pursue a HIGH signal-to-noise ratio. Then produce the digest items for exactly the stories you selected.
 
 ### SELECTION CRITERIA (strict):
 - Groundbreaking research or technical breakthroughs (new models, new methods, SOTA results)
@@ -742,127 +1345,33 @@ Before selecting any article, verify its URL does not contain an old date. For e
 - URL containing "/2026/02/" with a day more than 2 days before {target_date} → REJECT
 - URL containing "/2026/02/" with a day within 2 days of {target_date} → OK
 
-### OUTPUT FORMAT:
-Return ONLY a JSON array of the article numbers you selected. Example:
-[1, 5, 8, 12, 15, 18, 22, 25, 30, 33, 36, 40]
-
-Select 10-15 items. Ensure DIVERSITY: no two items should cover the same topic/event. No explanations."""
-
-    stage1_response = call_llm(stage1_prompt)
+Select 10-12 items. Ensure DIVERSITY: no two items should cover the same topic/event."""
 
-    # Parse selected indices
-    json_match = re.search(r'\[[\s\S]*?\]', stage1_response)
-    if json_match:
-        try:
-            selected_indices = json.loads(json_match.group(0))
-            selected_indices = [int(i) for i in selected_indices if isinstance(i, (int, float)) and 1 <= int(i) <= len(articles)]
-        except (json.JSONDecodeError, ValueError):
-            selected_indices = list(range(1, min(16, len(articles) + 1)))
-    else:
-        selected_indices = list(range(1, min(16, len(articles) + 1)))
-
-    # Clamp to 10-12 (fewer = safer for LLM token limits)
-    if len(selected_indices) < 8:
-        remaining = [i for i in range(1, len(articles) + 1) if i not in selected_indices]
-        selected_indices.extend(remaining[:12 - len(selected_indices)])
-    elif len(selected_indices) > 12:
-        selected_indices = selected_indices[:12]
-
-    selected_articles = [articles[i - 1] for i in selected_indices if i <= len(articles)]
-    log.info(f"  Stage 1: selected {len(selected_articles)} articles")
-
-    # ── Stage 2: Bilingual structured output ────────────────────────────
-    categories_desc = "\n".join(
-        f'  - "{en}" (Chinese: "{info["zh"]}", color: "{info["color"]}")'
-        for en, info in CATEGORIES.items()
+    raw = call_llm(
+        prompt,
+        system_prompt=_digest_system_prompt(),
+        max_tokens=16000,
+        response_format=DIGEST_RESPONSE_FORMAT,
     )
-
-    # Generate in two batches of ~6 to avoid token-limit truncation
-    mid = len(selected_articles) // 2
-    batch1 = selected_articles[:mid]
-    batch2 = selected_articles[mid:]
-
-    all_items_raw = []
-    for batch_num, batch in enumerate([batch1, batch2], 1):
-        if not batch:
-            continue
-        batch_text = build_article_list_text(batch)
-        batch_prompt = f"""You are a senior AI industry analyst. Create a bilingual (English + Chinese) news digest for the {len(batch)} pre-selected stories below.
-
-Today's date: {target_date}
-
-{batch_text}
-
-## OUTPUT FORMAT
-
-Return a JSON array. Each element must have this EXACT structure:
-
-{{
-  "id": "short-kebab-case-id",
-  "category_en": "Category Name",
-  "category_zh": "分类名称",
-  "category_color": "#hex",
-  "title_en": "Concise English headline",
-  "title_zh": "简洁中文标题",
-  "summary_en": "English analytical summary (3-5 sentences, ~400-600 chars). Self-contained: include all key facts, numbers, and context. Cover: what happened, technical details/metrics, why it matters.",
-  "summary_zh": "中文分析摘要（3-5句，约150-250字）。必须自包含：包含所有关键事实、数据和背景。涵盖：发生了什么、技术细节/指标、为什么重要。",
-  "source": "Source Name",
-  "sourceUrl": "https://..."
-}}
-
-## AVAILABLE CATEGORIES (use ONLY these):
-{categories_desc}
-
-## QUALITY REQUIREMENTS:
-- id: short, descriptive, kebab-case (e.g., "gpt5-release", "eu-ai-act-update")
-- Summaries must be SELF-CONTAINED
-- Chinese summaries should read naturally, use 「」for quotes
-- Include ALL {len(batch)} stories — do not skip any
-- source: use the newsletter/platform name
-- sourceUrl: use the article's actual URL
-
-## IMPORTANT:
-- Return ONLY the JSON array, no markdown fences, no explanations
-- Do NOT use smart/curly quotes — use only straight quotes
-- Ensure valid JSON"""
-
-        log.info(f"  Stage 2 batch {batch_num}/{2 if batch2 else 1}: {len(batch)} articles")
-        raw = call_llm(batch_prompt, max_tokens=8000)
-        raw = raw.strip()
-        if raw.startswith("```"):
-            raw = re.sub(r"^```(?:json)?\s*", "", raw)
-            raw = re.sub(r"\s*```$", "", raw)
-
-        # Attempt to recover truncated JSON by finding the last complete object
-        try:
-            batch_items = json.loads(raw)
-        except json.JSONDecodeError:
-            log.warning(f"  Batch {batch_num} JSON truncated, attempting recovery...")
-            # Find the last complete JSON object ending with }}
-            last_brace = raw.rfind("}")
-            if last_brace > 0:
-                recovered = raw[:last_brace + 1] + "]"
-                # Ensure it starts with [
-                if not recovered.lstrip().startswith("["):
-                    recovered = "[" + recovered
-                try:
-                    batch_items = json.loads(recovered)
-                    log.info(f"  Recovered {len(batch_items)} items from truncated response")
-                except json.JSONDecodeError as e2:
-                    log.error(f"  Recovery failed: {e2}")
-                    batch_items = []
-            else:
-                batch_items = []
-
-        all_items_raw.extend(batch_items)
-
-    items = all_items_raw
+    # The model occasionally emits a story twice; keep the first entry per URL
+    # (order-preserving), then cap at 12 (fewer = safer for page length)
+    unique_items = {}
+    for item in _parse_digest_items(raw):
+        unique_items.setdefault(item.get("sourceUrl") or item.get("id"), item)
+    items = list(unique_items.values())[:12]
+    log.info(f"  Selected and summarized {len(items)} stories")
 
     # Convert to frontend format
     news_items = []
     for item in items:
         cat_en = item.get("category_en", "Community Picks")
         cat_info = CATEGORIES.get(cat_en, CATEGORIES["Community Picks"])
+        # Few distinct sources across the items: share one str per name, so
+        # source_counts lookups hit the identity fast path
+        source = item.get("source") or ""
+        source = sys.intern(source) if isinstance(source, str) else str(source)
+        if source_counts is not None:
+            source_counts[source] += 1
 
         news_items.append({
             "id": item.get("id", f"news-{len(news_items)+1}"),
@@ -879,7 +1388,7 @@ Return a JSON array. Each element must have this EXACT structure:
                 "zh": item.get("summary_zh", ""),
                 "en": item.get("summary_en", ""),
             },
-            "source": item.get("source", ""),
+            "source": source,
             "sourceUrl": item.get("sourceUrl", ""),
             "date": target_date,
         })
@@ -891,32 +1400,37 @@ Return a JSON array. Each element must have this EXACT structure:
 # Main
 # ---------------------------------------------------------------------------
 
-def main():
-    run_start = time.time()
-
-    # Determine target date (UTC)
-    target_date = os.environ.get("TARGET_DATE", "")
-    if not target_date:
-        target_date = datetime.now(timezone.utc).strftime("%Y-%m-%d")
+# English month names for the date label; strftime("%B") follows the runner's locale
+_MONTHS_EN = (
+    "January", "February", "March", "April", "May", "June",
+    "July", "August", "September", "October", "November", "December",
+)
 
-    log.info(f"{'=' * 60}")
-    log.info(f"AI Daily Digest: {target_date}")
-    log.info(f"{'=' * 60}")
 
+def collect_articles(target_date: str) -> dict:
+    """
+    Collect, AI-filter and deduplicate the day's articles.
+    Returns the article pool together with its funnel counts for the crawl log.
+    """
     # ── Step 1: Collect articles from all sources ───────────────────────
-    log.info("\n[1/5] Collecting articles from newsletter feeds...")
-    newsletter_articles = fetch_newsletter_feeds(target_date, max_per_source=10)
-
-    log.info("\n[2/5] Collecting from supplementary feeds...")
-    supplementary_articles = fetch_supplementary_feeds(target_date, max_per_source=5)
-
-    log.info("\n[3/5] Collecting from Hacker News...")
-    hn_articles = fetch_hacker_news(target_date, max_items=15)
-
-    log.info("\n[4/5] Collecting from Reddit...")
-    reddit_articles = []
-    for sub in ["MachineLearning", "LocalLLaMA"]:
-        reddit_articles.extend(fetch_reddit(sub, target_date, max_items=10))
+    # All sources are network-bound and independent, so run them side by side;
+    # total collection time is roughly that of the slowest source.
+    log.info("\n[1/3] Collecting from newsletters, supplementary feeds, Hacker News and Reddit...")
+    with ThreadPoolExecutor(max_workers=5) as ex:
+        newsletter_future = ex.submit(fetch_newsletter_feeds, target_date, max_per_source=10)
+        supplementary_future = ex.submit(fetch_supplementary_feeds, target_date, max_per_source=5)
+        hn_future = ex.submit(fetch_hacker_news, target_date, max_items=15)
+        reddit_futures = [
+            ex.submit(fetch_reddit, sub, target_date, max_items=10)
+            for sub in ["MachineLearning", "LocalLLaMA"]
+        ]
+
+        newsletter_articles = newsletter_future.result()
+        supplementary_articles = supplementary_future.result()
+        hn_articles = hn_future.result()
+        reddit_articles = []
+        for future in reddit_futures:
+            reddit_articles.extend(future.result())
 
     # Combine all
     all_articles = newsletter_articles + hn_articles + reddit_articles + supplementary_articles
@@ -940,12 +1454,93 @@ def main():
     log.info(f"AI-related articles: {filtered_count}")
 
     # ── Step 3: Deduplicate against history ─────────────────────────────
-    log.info("\n[4/5] Deduplicating...")
-    DATA_DIR.mkdir(parents=True, exist_ok=True)
+    log.info("\n[2/3] Deduplicating...")
     historical_fps = load_historical_titles(DATA_DIR, DEDUP_DAYS)
     before_dedup = len(ai_articles)
     ai_articles = deduplicate_articles(ai_articles, historical_fps)
     dedup_removed = before_dedup - len(ai_articles)
+
+    return {
+        "articles": ai_articles,
+        "rawArticles": raw_count,
+        "afterFilter": filtered_count,
+        "dedupRemoved": dedup_removed,
+    }
+
+
+def _article_pool_path(target_date: str) -> Path:
+    return CACHE_DIR / "articles" / f"{target_date}.json.gz"
+
+
+def load_article_pool(target_date: str) -> dict | None:
+    """
+    Return the article pool cached by a recent run for target_date, or None.
+    Lets a re-run after a failed LLM step skip the whole collection phase.
+    """
+    if os.environ.get("NO_CACHE", "") == "1" or os.environ.get("FORCE_REFETCH", "") == "1":
+        return None
+
+    path = _article_pool_path(target_date)
+    try:
+        if time.time() - path.stat().st_mtime > ARTICLE_POOL_TTL:
+            return None
+    except FileNotFoundError:
+        return None
+
+    # A truncated or foreign entry is a miss: recollect and overwrite it
+    try:
+        pool = json_loads(gzip.decompress(path.read_bytes()))
+    except (OSError, EOFError, ValueError) as e:
+        log.warning(f"  Ignoring unreadable article pool {path}: {e}")
+        return None
+    if not (
+        isinstance(pool, dict)
+        and isinstance(pool.get("articles"), list)
+        and all(isinstance(pool.get(k), int) for k in ("rawArticles", "afterFilter", "dedupRemoved"))
+    ):
+        log.warning(f"  Ignoring malformed article pool {path}")
+        return None
+
+    log.info(f"\nReusing {len(pool['articles'])} collected articles from {path} (FORCE_REFETCH=1 to recollect)")
+    return pool
+
+
+def save_article_pool(target_date: str, pool: dict) -> None:
+    if os.environ.get("NO_CACHE", "") == "1":
+        return
+    path = _article_pool_path(target_date)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    write_atomic(path, gzip.compress(json_dumps(pool)))
+
+
+def main():
+    run_start = time.time()
+
+    # Determine target date (UTC)
+    target_date = os.environ.get("TARGET_DATE", "")
+    if not target_date:
+        target_date = datetime.now(timezone.utc).strftime("%Y-%m-%d")
+    # Parsed once up front (fails fast on a bad TARGET_DATE) and reused below.
+    # fromisoformat also takes forms like 20260701 or 2026-W27-3; the raw string
+    # names the output file and sorts the index, so only YYYY-MM-DD is accepted.
+    target_day = date.fromisoformat(target_date)
+    if target_day.isoformat() != target_date:
+        raise ValueError(f"TARGET_DATE must be YYYY-MM-DD, got {target_date!r}")
+
+    log.info(f"{'=' * 60}")
+    log.info(f"AI Daily Digest: {target_date}")
+    log.info(f"{'=' * 60}")
+
+    DATA_DIR.mkdir(parents=True, exist_ok=True)
+    pool = load_article_pool(target_date)
+    if pool is None:
+        pool = collect_articles(target_date)
+        save_article_pool(target_date, pool)
+
+    ai_articles = pool["articles"]
+    raw_count = pool["rawArticles"]
+    filtered_count = pool["afterFilter"]
+    dedup_removed = pool["dedupRemoved"]
     after_dedup_count = len(ai_articles)
 
     if after_dedup_count < 5:
@@ -954,9 +1549,10 @@ def main():
         sys.exit(0)
 
     # ── Step 4: Generate digest via LLM ─────────────────────────────────
-    log.info(f"\n[5/5] Generating bilingual digest from {after_dedup_count} articles...")
+    log.info(f"\n[3/3] Generating bilingual digest from {after_dedup_count} articles...")
+    source_counts = Counter()
     try:
-        news_items = generate_digest(ai_articles, target_date)
+        news_items = generate_digest(ai_articles, target_date, source_counts)
     except Exception as e:
         log.error(f"LLM generation failed: {e}", exc_info=True)
         sys.exit(1)
@@ -970,30 +1566,24 @@ def main():
 
     elapsed_seconds = round(time.time() - run_start)
 
-    # Build per-source breakdown from final news items
-    source_counts_final: dict[str, int] = {}
-    for item in news_items:
-        src = item.get("source", "Unknown")
-        source_counts_final[src] = source_counts_final.get(src, 0) + 1
-
     # Build crawl_log
     crawl_log = {
-        "fetchedAt": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
+        "fetchedAt": datetime.now(timezone.utc).isoformat(timespec="seconds").replace("+00:00", "Z"),
         "elapsedSeconds": elapsed_seconds,
         "rawArticles": raw_count,
         "afterFilter": filtered_count,
         "afterDedup": after_dedup_count,
         "dedupRemoved": dedup_removed,
         "finalStories": final_count,
-        "model": os.environ.get("LLM_MODEL", "gpt-4.1-mini"),
-        "sourceBreakdown": source_counts_final,
+        "model": LLM_MODEL,
+        "sourceBreakdown": dict(source_counts),
     }
 
     # ── Step 5: Write output ────────────────────────────────────────────
-    dt = datetime.strptime(target_date, "%Y-%m-%d")
+    y, m, d = target_day.year, target_day.month, target_day.day
     date_label = {
-        "zh": f"{dt.year}年{dt.month}月{dt.day}日",
-        "en": dt.strftime("%B %d, %Y"),
+        "zh": f"{y}年{m}月{d}日",
+        "en": f"{_MONTHS_EN[m - 1]} {d:02d}, {y}",
     }
 
     digest = {
@@ -1004,29 +1594,31 @@ def main():
     }
 
     output_path = DATA_DIR / f"{target_date}.json"
-    with open(output_path, "w", encoding="utf-8") as f:
-        json.dump(digest, f, ensure_ascii=False, indent=2)
+    # Compact: the frontend is the only reader. Encode once and hand the
+    # kernel a single buffer
+    write_atomic(output_path, json_dumps(digest))
     log.info(f"Written: {output_path}")
 
     # Update index.json
     index_path = DATA_DIR / "index.json"
-    if index_path.exists():
-        with open(index_path, "r", encoding="utf-8") as f:
-            index = json.load(f)
-    else:
+    try:
+        old_index_bytes = index_path.read_bytes()
+        index = json_loads(old_index_bytes)
+    except FileNotFoundError:
+        old_index_bytes = b""
         index = {"dates": [], "latest": ""}
 
-    if target_date not in index["dates"]:
-        index["dates"].append(target_date)
-        index["dates"].sort(reverse=True)
+    # Newest first, last 30 days only. ISO dates order lexicographically, and
+    # the set drops a repeated date in the same pass.
+    dates = heapq.nlargest(30, set(index["dates"]) | {target_date})
+    index_bytes = json_dumps({**index, "dates": dates, "latest": dates[0]}, indent=True)
 
-    # Keep only last 30 days
-    index["dates"] = index["dates"][:30]
-    index["latest"] = index["dates"][0]
-
-    with open(index_path, "w", encoding="utf-8") as f:
-        json.dump(index, f, ensure_ascii=False, indent=2)
-    log.info(f"Updated: {index_path}")
+    # Re-runs for a date already at the head of the index change nothing
+    if index_bytes == old_index_bytes:
+        log.info(f"Unchanged: {index_path}")
+    else:
+        write_atomic(index_path, index_bytes)
+        log.info(f"Updated: {index_path}")
 
     log.info(f"\n{'=' * 60}")
     log.info(f"Done! {len(news_items)} stories for {target_date}")